@@ -1,19 +1,45 @@
 import argparse
+import functools
+import importlib
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from asksageclient import AskSageClient
+from .errors import CliError, wrap_errors
 
-from .commands import datasets, train, query, tokens
-from .mock_client import MockAskSageClient
+if TYPE_CHECKING:
+    from asksageclient import AskSageClient
 
 
-def get_client() -> AskSageClient:
+# Subcommand names and their help text. Command modules are only imported
+# (and their parsers only built) for the subcommand actually invoked.
+COMMANDS = {
+    'datasets': 'Manage datasets',
+    'train': 'Train content into datasets',
+    'query': 'Query AskSage AI models',
+    'tokens': 'Check token usage statistics',
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse the config file; mtime and size key the cache so edits are picked up."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def get_client() -> 'AskSageClient':
     """Initialize and return AskSage client with credentials from environment or config."""
     # Check for test mode
     if os.getenv('ASKSAGE_TEST_MODE', '').lower() in ('1', 'true', 'yes'):
+        from .mock_client import MockAskSageClient
         print("Running in test mode with mock client")
         return MockAskSageClient(email="test@example.com", api_key="test_key")
     
@@ -24,24 +50,23 @@ def get_client() -> AskSageClient:
     
     if not email or not api_key:
         config_path = Path.home() / '.asksage' / 'config.json'
-        if config_path.exists():
-            import json
-            try:
-                with open(config_path) as f:
-                    config = json.load(f)
-                email = config.get('email', email)
-                api_key = config.get('api_key', api_key)
-                user_base_url = config.get('user_base_url', user_base_url)
-                server_base_url = config.get('server_base_url', server_base_url)
-            except (json.JSONDecodeError, KeyError, FileNotFoundError):
-                pass
+        try:
+            st = os.stat(config_path)
+            config = _load_config(str(config_path), st.st_mtime_ns, st.st_size)
+        except (OSError, ValueError):
+            config = {}
+        email = config.get('email', email)
+        api_key = config.get('api_key', api_key)
+        user_base_url = config.get('user_base_url', user_base_url)
+        server_base_url = config.get('server_base_url', server_base_url)
     
     if not email or not api_key:
-        print("Error: AskSage credentials not found.", file=sys.stderr)
-        print("Set ASKSAGE_EMAIL and ASKSAGE_API_KEY environment variables,", file=sys.stderr)
-        print("or create ~/.asksage/config.json with your credentials.", file=sys.stderr)
-        print("Or set ASKSAGE_TEST_MODE=1 to use mock client for testing.", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(
+            "Error: AskSage credentials not found.\n"
+            "Set ASKSAGE_EMAIL and ASKSAGE_API_KEY environment variables,\n"
+            "or create ~/.asksage/config.json with your credentials.\n"
+            "Or set ASKSAGE_TEST_MODE=1 to use mock client for testing."
+        )
     
     # Build client arguments
     client_args = {'email': email, 'api_key': api_key}
@@ -50,11 +75,12 @@ def get_client() -> AskSageClient:
     if server_base_url:
         client_args['server_base_url'] = server_base_url
     
-    return AskSageClient(**client_args)
+    from .client import CliClient
+    return CliClient(**client_args)
 
 
-def main() -> None:
-    """Main CLI entry point."""
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, fully registering only the given subcommand."""
     parser = argparse.ArgumentParser(
         prog='asksage',
         description='Command-line interface for AskSage AI platform',
@@ -63,31 +89,42 @@ def main() -> None:
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Register subcommands
-    datasets.register_parser(subparsers)
-    train.register_parser(subparsers)
-    query.register_parser(subparsers)
-    tokens.register_parser(subparsers)
+    for name, help_text in COMMANDS.items():
+        if name == command:
+            _load_command(name).register_parser(subparsers)
+        else:
+            # Placeholder so the command shows up in --help; add_help=False lets
+            # '<command> --help' fall through to the fully registered parser.
+            subparsers.add_parser(name, help=help_text, add_help=False)
     
-    args = parser.parse_args()
+    return parser
+
+
+def _load_command(name: str):
+    """Import and return the command module for the given subcommand."""
+    return importlib.import_module(f'.commands.{name}', __package__)
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    # First pass only discovers which subcommand was requested
+    parser = _build_parser()
+    args, extra = parser.parse_known_args()
     
     if not args.command:
+        # Without a subcommand nothing else can consume the leftovers
+        if extra:
+            parser.error(f"unrecognized arguments: {' '.join(extra)}")
         parser.print_help()
         return
     
-    # Get client instance
-    try:
-        client = get_client()
-    except Exception as e:
-        print(f"Error initializing AskSage client: {e}", file=sys.stderr)
-        sys.exit(1)
+    args = _build_parser(args.command).parse_args()
     
-    # Execute the appropriate command
-    if args.command == 'datasets':
-        datasets.execute(client, args)
-    elif args.command == 'train':
-        train.execute(client, args)
-    elif args.command == 'query':
-        query.execute(client, args)
-    elif args.command == 'tokens':
-        tokens.execute(client, args)
+    try:
+        with wrap_errors("Error initializing AskSage client"):
+            client = get_client()
+        
+        _load_command(args.command).execute(client, args)
+    except CliError as e:
+        print(e, file=sys.stderr)
+        sys.exit(e.code)
@@ -0,0 +1,29 @@
+"""Utilities for handling AskSage API responses."""
+
+from typing import Any
+
+
+class ApiError(Exception):
+    """Raised when an AskSage API response reports an error status."""
+
+
+def unwrap(response: Any, key: str = 'response', default: Any = None) -> Any:
+    """
+    Check an API response for errors and extract its payload.
+
+    Args:
+        response: Raw value returned by a client method
+        key: Key holding the payload in dict responses
+        default: Value to return when a dict response has no payload under key
+
+    Returns:
+        The payload of a dict response, or the response itself for any other type
+
+    Raises:
+        ApiError: If the response carries a status code of 400 or above
+    """
+    if isinstance(response, dict):
+        if response.get('status', 200) >= 400:
+            raise ApiError(response.get('error') or response.get('message', 'Unknown error'))
+        return response.get(key, default)
+    return response
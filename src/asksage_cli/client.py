@@ -0,0 +1,94 @@
+"""AskSage client adjustments for command-line use."""
+
+import hashlib
+import logging
+from typing import Any, Dict
+
+import requests
+from asksageclient import AskSageClient
+from requests.adapters import HTTPAdapter
+from requests.utils import guess_filename
+
+from .http_utils import POOL_MAXSIZE
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    # Optional dependency; without it uploads are buffered by requests
+    MultipartEncoder = None
+
+logger = logging.getLogger(__name__)
+
+
+class CliClient(AskSageClient):
+    """
+    AskSageClient tuned for command-line use.
+    
+    Requests share one requests.Session, so the connection (and TLS handshake)
+    made for the token request is reused by every later call, and file uploads
+    are streamed instead of buffered in memory.
+    """
+
+    def __init__(self, email, api_key, *args, **kwargs):
+        # AskSageClient only uses the email to request a token; keep it to
+        # identify the user for the on-disk dataset cache
+        self.email = email
+        
+        # The session must exist before AskSageClient.__init__ requests a token
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        super().__init__(email, api_key, *args, **kwargs)
+
+    @property
+    def datasets_cache_key(self) -> str:
+        """Key naming this user's on-disk dataset cache, derived from the server URL and email."""
+        return hashlib.sha256(f"{self.server_base_url}\n{self.email}".encode()).hexdigest()[:16]
+
+    def _request(self, method, endpoint, json=None, files=None, base_url=None, skip_headers=False, data=None):
+        """
+        Perform an HTTP request on the shared session, streaming multipart bodies when possible.
+        
+        requests encodes multipart bodies fully in memory before sending.
+        MultipartEncoder reads the file handles lazily as the body is written,
+        so peak memory no longer grows with the size of the uploaded file.
+        """
+        url = f"{base_url or self.server_base_url}/{endpoint}"
+        headers = None if skip_headers else self.headers
+        
+        if files is not None and MultipartEncoder is not None:
+            encoder = MultipartEncoder(fields=_multipart_fields(data, files))
+            headers = dict(headers or {})
+            headers['Content-Type'] = encoder.content_type
+            files, data = None, encoder
+        
+        request_args = {'headers': headers, 'json': json, 'files': files, 'data': data}
+        # Older asksageclient releases have no CA bundle setting at all
+        ca_bundle = getattr(self, 'path_to_CA_Bundle', None)
+        if ca_bundle is not None:
+            request_args['verify'] = ca_bundle
+        
+        try:
+            response = self._session.post(url, **request_args)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException:
+            # Not self.logger: some asksageclient releases only set it after
+            # the token request made in __init__
+            logger.error("Request to %s failed", url, exc_info=True)
+            raise
+
+
+def _multipart_fields(data: Dict[str, Any], files: Dict[str, Any]) -> Dict[str, Any]:
+    """Build MultipartEncoder fields matching how requests encodes data and files."""
+    # requests drops None values and sends everything else as text
+    fields = {key: str(value) for key, value in (data or {}).items() if value is not None}
+
+    for key, value in files.items():
+        if isinstance(value, tuple):
+            fields[key] = value
+        else:
+            fields[key] = (guess_filename(value) or key, value)
+
+    return fields
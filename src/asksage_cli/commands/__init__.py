@@ -0,0 +1,8 @@
+import argparse
+
+
+def dataset_parent_parser(help_text: str, required: bool = False) -> argparse.ArgumentParser:
+    """Build a parent parser holding the shared --dataset/-d option."""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument('--dataset', '-d', required=required, help=help_text)
+    return parent
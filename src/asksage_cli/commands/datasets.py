@@ -2,11 +2,16 @@ import argparse
 import sys
 from typing import TYPE_CHECKING
 
-from ..dataset_utils import resolve_dataset_name, extract_short_name, list_datasets_with_short_names
+from ..api_utils import ApiError, unwrap
+from ..dataset_utils import resolve_dataset_name, format_dataset_name, invalidate_datasets_cache, update_datasets_cache
+from ..errors import CliError, wrap_errors
 
 if TYPE_CHECKING:
     from asksageclient import AskSageClient
 
+# Strips the separators allowed in dataset names in a single pass
+_NAME_SEPARATORS = str.maketrans('', '', '-_')
+
 
 def register_parser(subparsers) -> None:
     """Register the datasets subcommand parser."""
@@ -28,42 +33,26 @@ def register_parser(subparsers) -> None:
 def execute(client: 'AskSageClient', args: argparse.Namespace) -> None:
     """Execute the datasets command."""
     if not args.datasets_action:
-        print("Error: No datasets action specified. Use 'add', 'delete', or 'list'.", file=sys.stderr)
-        sys.exit(1)
+        raise CliError("Error: No datasets action specified. Use 'add', 'delete', or 'list'.")
     
-    try:
-        if args.datasets_action == 'add':
-            _add_dataset(client, args.name)
-        elif args.datasets_action == 'delete':
-            _delete_dataset(client, args.name)
-        elif args.datasets_action == 'list':
-            _list_datasets(client)
-    except Exception as e:
-        print(f"Error executing datasets command: {e}", file=sys.stderr)
-        sys.exit(1)
+    with wrap_errors("Error executing datasets command"):
+        _ACTIONS[args.datasets_action](client, args)
 
 
 def _add_dataset(client: 'AskSageClient', name: str) -> None:
     """Add a new dataset."""
-    if not name.replace('-', '').replace('_', '').isalnum():
-        print("Error: Dataset name must be alphanumeric (hyphens and underscores allowed).", file=sys.stderr)
-        sys.exit(1)
+    if not name.translate(_NAME_SEPARATORS).isalnum():
+        raise CliError("Error: Dataset name must be alphanumeric (hyphens and underscores allowed).")
     
     response = client.add_dataset(dataset=name)
     
-    if isinstance(response, dict):
-        # Check for API error responses based on status codes
-        status = response.get('status', 200)
-        if status >= 400:
-            error_msg = response.get('error') or response.get('message', 'Unknown error')
-            print(f"Failed to add dataset: {error_msg}", file=sys.stderr)
-            sys.exit(1)
-        else:
-            # Success response - dataset added
-            print(f"Successfully added dataset: {name}")
-    else:
-        # Handle non-dict responses
-        print(f"Successfully added dataset: {name}")
+    try:
+        unwrap(response)
+    except ApiError as e:
+        raise CliError(f"Failed to add dataset: {e}") from e
+    
+    invalidate_datasets_cache(client)
+    print(f"Successfully added dataset: {name}")
 
 
 def _delete_dataset(client: 'AskSageClient', name: str) -> None:
@@ -72,68 +61,48 @@ def _delete_dataset(client: 'AskSageClient', name: str) -> None:
     full_name = resolve_dataset_name(client, name)
     
     if full_name is None:
-        print(f"Error: Dataset '{name}' not found.", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Error: Dataset '{name}' not found.")
     
     response = client.delete_dataset(dataset=full_name)
     
-    if isinstance(response, dict):
-        # Check for API error responses based on status codes
-        status = response.get('status', 200)
-        if status >= 400:
-            error_msg = response.get('error') or response.get('message', 'Unknown error')
-            print(f"Failed to delete dataset: {error_msg}", file=sys.stderr)
-            sys.exit(1)
-        else:
-            # Success response - dataset deleted
-            short_name = extract_short_name(full_name)
-            if short_name != full_name:
-                print(f"Successfully deleted dataset: {short_name} ({full_name})")
-            else:
-                print(f"Successfully deleted dataset: {full_name}")
-    else:
-        # Handle non-dict responses - assume success if no error
-        short_name = extract_short_name(full_name)
-        if short_name != full_name:
-            print(f"Successfully deleted dataset: {short_name} ({full_name})")
-        else:
-            print(f"Successfully deleted dataset: {full_name}")
+    try:
+        unwrap(response)
+    except ApiError as e:
+        raise CliError(f"Failed to delete dataset: {e}") from e
+    
+    invalidate_datasets_cache(client)
+    print(f"Successfully deleted dataset: {format_dataset_name(full_name)}")
 
 
 def _list_datasets(client: 'AskSageClient') -> None:
     """List all datasets."""
-    try:
+    # API errors are reported with the same prefix as other failures
+    with wrap_errors("Failed to retrieve datasets"):
         # Get datasets directly from client
         response = client.get_datasets()
         
-        # Handle different response formats
-        if isinstance(response, dict):
-            status = response.get('status', 200)
-            if status >= 400:
-                error_msg = response.get('error') or response.get('message', 'Unknown error')
-                print(f"Failed to retrieve datasets: {error_msg}", file=sys.stderr)
-                sys.exit(1)
-            
-            # Extract dataset list from response
-            datasets = response.get('response', [])
-        elif isinstance(response, list):
-            datasets = response
-        else:
-            print(f"Unexpected response format: {response}", file=sys.stderr)
-            sys.exit(1)
+        if not isinstance(response, (dict, list)):
+            raise CliError(f"Unexpected response format: {response}")
+        
+        datasets = unwrap(response, default=[])
+        
+        # Keep the list short names are resolved against in step with this one
+        if isinstance(datasets, list):
+            update_datasets_cache(client, datasets)
         
         if not datasets:
             print("No datasets found.")
             return
         
-        print("Available datasets:")
-        for dataset_name in datasets:
-            short_name = extract_short_name(dataset_name)
-            if short_name != dataset_name:
-                print(f"  - {short_name} ({dataset_name})")
-            else:
-                print(f"  - {dataset_name}")
-            
-    except Exception as e:
-        print(f"Failed to retrieve datasets: {e}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+        # Build the listing up front and emit it with a single write
+        lines = ["Available datasets:"]
+        lines.extend(f"  - {format_dataset_name(dataset_name)}" for dataset_name in datasets)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Dispatch table for datasets actions, keyed by subcommand name
+_ACTIONS = {
+    'add': lambda client, args: _add_dataset(client, args.name),
+    'delete': lambda client, args: _delete_dataset(client, args.name),
+    'list': lambda client, args: _list_datasets(client),
+}
@@ -1,9 +1,13 @@
 import argparse
-import sys
+import os
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from . import dataset_parent_parser
+from ..api_utils import ApiError, unwrap
 from ..dataset_utils import resolve_dataset_name, extract_short_name
+from ..errors import CliError, wrap_errors
 
 if TYPE_CHECKING:
     from asksageclient import AskSageClient
@@ -11,9 +15,9 @@ if TYPE_CHECKING:
 
 def register_parser(subparsers) -> None:
     """Register the query subcommand parser."""
-    parser = subparsers.add_parser('query', help='Query AskSage AI models')
+    dataset_parser = dataset_parent_parser('Limit query to specific dataset (short name or full name)')
+    parser = subparsers.add_parser('query', parents=[dataset_parser], help='Query AskSage AI models')
     parser.add_argument('message', help='The question or message to query')
-    parser.add_argument('--dataset', '-d', help='Limit query to specific dataset (short name or full name)')
     parser.add_argument('--model', '-m', help='Specify AI model to use')
     parser.add_argument('--file', '-f', help='Include a file with the query')
     parser.add_argument('--persona', '-p', help='Use a specific persona for the query')
@@ -22,123 +26,88 @@ def register_parser(subparsers) -> None:
 
 def execute(client: 'AskSageClient', args: argparse.Namespace) -> None:
     """Execute the query command."""
-    try:
+    with wrap_errors("Error executing query"):
         if args.file:
             _query_with_file(client, args)
         elif args.plugin:
             _query_with_plugin(client, args)
         else:
             _query_basic(client, args)
-    except Exception as e:
-        print(f"Error executing query: {e}", file=sys.stderr)
-        sys.exit(1)
+
+
+def _dataset_kwargs(client: 'AskSageClient', args: argparse.Namespace) -> dict:
+    """
+    Resolve the --dataset option into keyword arguments for the query call.
+    
+    The dataset is passed with the query itself rather than through a
+    separate assign_dataset call, saving a round-trip per query.
+    """
+    if not args.dataset:
+        return {}
+    
+    dataset_name = resolve_dataset_name(client, args.dataset)
+    if dataset_name is None:
+        raise CliError(f"Error: Dataset '{args.dataset}' not found.")
+    return {'dataset': dataset_name}
 
 
 def _query_basic(client: 'AskSageClient', args: argparse.Namespace) -> None:
     """Execute a basic text query."""
-    try:
-        # Resolve and assign dataset if specified
-        if args.dataset:
-            dataset_name = resolve_dataset_name(client, args.dataset)
-            if dataset_name is None:
-                print(f"Error: Dataset '{args.dataset}' not found.", file=sys.stderr)
-                sys.exit(1)
-            client.assign_dataset(dataset=dataset_name)
+    with wrap_errors("Error executing query"):
+        dataset_kwargs = _dataset_kwargs(client, args)
         
-        response = client.query(message=args.message)
+        response = client.query(message=args.message, **dataset_kwargs)
         
-        if isinstance(response, dict):
-            # Check for API error responses
-            if response.get('status', 200) >= 400:
-                error_msg = response.get('error') or response.get('message', 'Unknown error')
-                print(f"Query failed: {error_msg}", file=sys.stderr)
-                sys.exit(1)
-            else:
-                # Extract response message from proper API format
-                message = response.get('message') or response.get('response', 'No response content')
-                print(message)
-        else:
-            # Handle string response
-            print(response)
-            
-    except Exception as e:
-        print(f"Error executing query: {e}", file=sys.stderr)
-        sys.exit(1)
+        _print_response(response)
 
 
 def _query_with_file(client: 'AskSageClient', args: argparse.Namespace) -> None:
     """Execute a query with an attached file."""
     file_path = Path(args.file)
     
-    if not file_path.exists():
-        print(f"Error: File not found: {file_path}", file=sys.stderr)
-        sys.exit(1)
+    # A single stat answers both the existence and the file-type check
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        raise CliError(f"Error: File not found: {file_path}")
     
-    if not file_path.is_file():
-        print(f"Error: Path is not a file: {file_path}", file=sys.stderr)
-        sys.exit(1)
+    if not stat.S_ISREG(st.st_mode):
+        raise CliError(f"Error: Path is not a file: {file_path}")
     
-    try:
-        # Resolve and assign dataset if specified
-        if args.dataset:
-            dataset_name = resolve_dataset_name(client, args.dataset)
-            if dataset_name is None:
-                print(f"Error: Dataset '{args.dataset}' not found.", file=sys.stderr)
-                sys.exit(1)
-            client.assign_dataset(dataset=dataset_name)
+    with wrap_errors("Error executing query with file"):
+        dataset_kwargs = _dataset_kwargs(client, args)
         
         response = client.query_with_file(
             message=args.message,
-            file_path=str(file_path)
+            file=str(file_path),
+            **dataset_kwargs
         )
         
-        if isinstance(response, dict):
-            # Check for API error responses
-            if response.get('status', 200) >= 400:
-                error_msg = response.get('error') or response.get('message', 'Unknown error')
-                print(f"Query failed: {error_msg}", file=sys.stderr)
-                sys.exit(1)
-            else:
-                # Extract response message from proper API format
-                message = response.get('message') or response.get('response', 'No response content')
-                print(message)
-        else:
-            print(response)
-            
-    except Exception as e:
-        print(f"Error executing query with file: {e}", file=sys.stderr)
-        sys.exit(1)
+        _print_response(response)
 
 
 def _query_with_plugin(client: 'AskSageClient', args: argparse.Namespace) -> None:
     """Execute a query using a specific plugin."""
-    try:
-        # Resolve and assign dataset if specified
-        if args.dataset:
-            dataset_name = resolve_dataset_name(client, args.dataset)
-            if dataset_name is None:
-                print(f"Error: Dataset '{args.dataset}' not found.", file=sys.stderr)
-                sys.exit(1)
-            client.assign_dataset(dataset=dataset_name)
+    with wrap_errors("Error executing plugin query"):
+        dataset_kwargs = _dataset_kwargs(client, args)
         
         response = client.query_plugin(
             message=args.message,
-            plugin_name=args.plugin
+            plugin_name=args.plugin,
+            **dataset_kwargs
         )
         
-        if isinstance(response, dict):
-            # Check for API error responses
-            if response.get('status', 200) >= 400:
-                error_msg = response.get('error') or response.get('message', 'Unknown error')
-                print(f"Query failed: {error_msg}", file=sys.stderr)
-                sys.exit(1)
-            else:
-                # Extract response message from proper API format
-                message = response.get('message') or response.get('response', 'No response content')
-                print(message)
-        else:
-            print(response)
-            
-    except Exception as e:
-        print(f"Error executing plugin query: {e}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+        _print_response(response)
+
+
+def _print_response(response) -> None:
+    """Print the answer text from a query response, raising CliError on API errors."""
+    try:
+        message = unwrap(response, 'message')
+    except ApiError as e:
+        raise CliError(f"Query failed: {e}") from e
+    
+    if isinstance(response, dict):
+        # Fall back to the generic payload key when there is no message
+        message = message or response.get('response', 'No response content')
+    print(message)
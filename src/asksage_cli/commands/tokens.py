@@ -1,10 +1,17 @@
 import argparse
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from ..api_utils import unwrap
+from ..errors import wrap_errors
+
 if TYPE_CHECKING:
     from asksageclient import AskSageClient
 
+# Thousands-grouped integer formatter, bound once instead of parsing a
+# format spec inside each f-string
+_group_thousands = "{:,}".format
+
 
 def register_parser(subparsers) -> None:
     """Register the tokens subcommand parser."""
@@ -15,29 +22,26 @@ def register_parser(subparsers) -> None:
 
 def execute(client: 'AskSageClient', args: argparse.Namespace) -> None:
     """Execute the tokens command."""
-    try:
+    with wrap_errors("Error retrieving token usage"):
         _show_token_usage(client, args.format)
-    except Exception as e:
-        print(f"Error retrieving token usage: {e}", file=sys.stderr)
-        sys.exit(1)
 
 
 def _show_token_usage(client: 'AskSageClient', output_format: str) -> None:
     """Show monthly token usage statistics."""
-    try:
-        # Get monthly token counts
-        monthly_response = client.count_monthly_tokens()
-        teach_response = client.count_monthly_teach_tokens()
+    with wrap_errors("Failed to retrieve token usage"):
+        # Get monthly token counts; the two requests are independent, so
+        # issue them concurrently rather than back to back
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            monthly_future = executor.submit(client.count_monthly_tokens)
+            teach_future = executor.submit(client.count_monthly_teach_tokens)
+            monthly_response = monthly_future.result()
+            teach_response = teach_future.result()
         
         # Handle different response formats
         def extract_token_count(response):
             if isinstance(response, dict):
-                status = response.get('status', 200)
-                if status >= 400:
-                    error_msg = response.get('error') or response.get('message', 'Unknown error')
-                    raise Exception(f"API error: {error_msg}")
-                # Extract count from API response format
-                return response.get('response', 0)
+                # API errors raise ApiError; the payload is returned as-is
+                return unwrap(response, default=0)
             elif isinstance(response, (int, float)):
                 return int(response)
             else:
@@ -47,18 +51,23 @@ def _show_token_usage(client: 'AskSageClient', output_format: str) -> None:
         teach_tokens = extract_token_count(teach_response)
         
         if output_format == 'json':
-            import json
             data = {
                 'monthly_tokens': monthly_tokens,
                 'teach_tokens': teach_tokens
             }
-            print(json.dumps(data, indent=2))
+            print(_dumps_indented(data))
         else:
             # Human-readable format
             print("Monthly Token Usage:")
-            print(f"  Query Tokens:    {monthly_tokens:,}")
-            print(f"  Teaching Tokens: {teach_tokens:,}")
-            
-    except Exception as e:
-        print(f"Failed to retrieve token usage: {e}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+            print(f"  Query Tokens:    {_group_thousands(monthly_tokens)}")
+            print(f"  Teaching Tokens: {_group_thousands(teach_tokens)}")
+
+
+def _dumps_indented(data: dict) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
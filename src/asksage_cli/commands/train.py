@@ -1,10 +1,15 @@
 import argparse
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
-from ..dataset_utils import resolve_dataset_name, extract_short_name
+from . import dataset_parent_parser
+from ..api_utils import ApiError, unwrap
+from ..dataset_utils import resolve_dataset_name, extract_short_name, format_dataset_name, invalidate_datasets_cache
+from ..errors import CliError, wrap_errors
+from ..http_utils import POOL_MAXSIZE
 
 if TYPE_CHECKING:
     from asksageclient import AskSageClient
@@ -15,38 +20,31 @@ def register_parser(subparsers) -> None:
     parser = subparsers.add_parser('train', help='Train content into datasets')
     train_subparsers = parser.add_subparsers(dest='train_action', help='Training actions')
     
+    # Options shared by every training action
+    common_parser = dataset_parent_parser('Dataset name to train into (short name or full name)', required=True)
+    common_parser.add_argument('--summarize', action='store_true', help='Enable summarization during training')
+    
     # train file
-    file_parser = train_subparsers.add_parser('file', help='Train a single file')
+    file_parser = train_subparsers.add_parser('file', parents=[common_parser], help='Train a single file')
     file_parser.add_argument('path', help='Path to the file to train')
-    file_parser.add_argument('--dataset', '-d', required=True, help='Dataset name to train into (short name or full name)')
-    file_parser.add_argument('--context', '-c', help='Optional context information')
-    file_parser.add_argument('--summarize', action='store_true', help='Enable summarization during training')
     
     # train directory
-    dir_parser = train_subparsers.add_parser('directory', help='Train all files in a directory')
+    dir_parser = train_subparsers.add_parser('directory', parents=[common_parser], help='Train all files in a directory')
     dir_parser.add_argument('path', help='Path to the directory to train')
-    dir_parser.add_argument('--dataset', '-d', required=True, help='Dataset name to train into (short name or full name)')
-    dir_parser.add_argument('--context', '-c', help='Optional context information')
-    dir_parser.add_argument('--summarize', action='store_true', help='Enable summarization during training')
     dir_parser.add_argument('--recursive', '-r', action='store_true', help='Process directories recursively')
     dir_parser.add_argument('--extensions', nargs='*', default=['.txt', '.md', '.py', '.js', '.json'], 
                           help='File extensions to include (default: .txt .md .py .js .json)')
+    dir_parser.add_argument('--concurrency', '-j', type=int, default=8,
+                          help=f'Number of files to upload in parallel, at most {POOL_MAXSIZE} (default: 8)')
 
 
 def execute(client: 'AskSageClient', args: argparse.Namespace) -> None:
     """Execute the train command."""
     if not args.train_action:
-        print("Error: No train action specified. Use 'file' or 'directory'.", file=sys.stderr)
-        sys.exit(1)
+        raise CliError("Error: No train action specified. Use 'file' or 'directory'.")
     
-    try:
-        if args.train_action == 'file':
-            _train_file(client, args)
-        elif args.train_action == 'directory':
-            _train_directory(client, args)
-    except Exception as e:
-        print(f"Error executing train command: {e}", file=sys.stderr)
-        sys.exit(1)
+    with wrap_errors("Error executing train command"):
+        _ACTIONS[args.train_action](client, args)
 
 
 def _train_file(client: 'AskSageClient', args: argparse.Namespace) -> None:
@@ -54,53 +52,38 @@ def _train_file(client: 'AskSageClient', args: argparse.Namespace) -> None:
     file_path = Path(args.path)
     
     if not file_path.exists():
-        print(f"Error: File not found: {file_path}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Error: File not found: {file_path}")
     
     if not file_path.is_file():
-        print(f"Error: Path is not a file: {file_path}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Error: Path is not a file: {file_path}")
     
     # Resolve dataset name
     dataset_name = resolve_dataset_name(client, args.dataset)
     if dataset_name is None:
-        print(f"Error: Dataset '{args.dataset}' not found.", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Error: Dataset '{args.dataset}' not found.")
     
     print(f"Training file: {file_path}")
-    short_name = extract_short_name(dataset_name)
-    if short_name != dataset_name:
-        print(f"Using dataset: {short_name} ({dataset_name})")
-    else:
-        print(f"Using dataset: {dataset_name}")
+    print(f"Using dataset: {format_dataset_name(dataset_name)}")
     
-    try:
+    with wrap_errors(f"Error training file {file_path}"):
         # Use train_with_file method from the client
         response = client.train_with_file(
             file_path=str(file_path),
-            context=args.context,
             dataset=dataset_name
         )
-        
-        if isinstance(response, dict):
-            # Check for API error responses based on status codes
-            status = response.get('status', 200)
-            if status >= 400:
-                error_msg = response.get('error') or response.get('message', 'Unknown error')
-                print(f"Failed to train file: {error_msg}", file=sys.stderr)
-                sys.exit(1)
-            else:
-                # Success response - file trained
-                display_name = short_name if short_name != dataset_name else dataset_name
-                print(f"Successfully trained file {file_path} into dataset '{display_name}'")
-        else:
-            # Handle non-dict responses - assume success if no error
-            display_name = short_name if short_name != dataset_name else dataset_name
-            print(f"Successfully trained file {file_path} into dataset '{display_name}'")
-            
-    except Exception as e:
-        print(f"Error training file {file_path}: {e}", file=sys.stderr)
-        sys.exit(1)
+    
+    # Check for API error responses based on status codes; non-dict
+    # responses are treated as success
+    try:
+        unwrap(response)
+    except ApiError as e:
+        # The dataset may have changed server-side; refetch next time
+        invalidate_datasets_cache(client)
+        raise CliError(f"Failed to train file: {e}") from e
+    
+    # extract_short_name returns names without a short form unchanged
+    display_name = extract_short_name(dataset_name)
+    print(f"Successfully trained file {file_path} into dataset '{display_name}'")
 
 
 def _train_directory(client: 'AskSageClient', args: argparse.Namespace) -> None:
@@ -108,88 +91,135 @@ def _train_directory(client: 'AskSageClient', args: argparse.Namespace) -> None:
     dir_path = Path(args.path)
     
     if not dir_path.exists():
-        print(f"Error: Directory not found: {dir_path}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Error: Directory not found: {dir_path}")
     
     if not dir_path.is_dir():
-        print(f"Error: Path is not a directory: {dir_path}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Error: Path is not a directory: {dir_path}")
+    
+    # Uploads beyond the client's connection pool size would not reuse connections
+    if not 1 <= args.concurrency <= POOL_MAXSIZE:
+        raise CliError(f"Error: --concurrency must be between 1 and {POOL_MAXSIZE}.")
     
     # Resolve dataset name
     dataset_name = resolve_dataset_name(client, args.dataset)
     if dataset_name is None:
-        print(f"Error: Dataset '{args.dataset}' not found.", file=sys.stderr)
-        sys.exit(1)
-    
-    # Collect files to train
-    files_to_train = _collect_files(dir_path, args.extensions, args.recursive)
-    
-    if not files_to_train:
-        print(f"No files found in directory {dir_path} with extensions {args.extensions}")
-        return
+        raise CliError(f"Error: Dataset '{args.dataset}' not found.")
     
-    short_name = extract_short_name(dataset_name)
-    display_name = short_name if short_name != dataset_name else dataset_name
-    print(f"Found {len(files_to_train)} files to train in dataset '{display_name}'")
+    display_name = extract_short_name(dataset_name)
+    print(f"Training files from {dir_path} into dataset '{display_name}'")
     
-    successful = 0
+    submitted = 0
     failed = 0
     
-    for file_path in files_to_train:
-        print(f"Training: {file_path.relative_to(dir_path)}")
-        
-        try:
-            response = client.train_with_file(
-                file_path=str(file_path),
-                context=args.context,
-                dataset=dataset_name
-            )
+    # Uploads are network-bound, so run them in a thread pool and report
+    # each file as it finishes. Files are submitted while the directory walk
+    # is still running; a bounded number of pending uploads keeps memory flat
+    # for very large trees.
+    max_pending = args.concurrency * 2
+    pending = {}
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for file_path in _collect_files(dir_path, args.extensions, args.recursive):
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    failed += not _report_result(dir_path, pending.pop(future), future.result())
             
-            if isinstance(response, dict):
-                # Check for API error responses based on status codes
-                status = response.get('status', 200)
-                if status >= 400:
-                    failed += 1
-                    error_msg = response.get('error') or response.get('message', 'Unknown error')
-                    print(f"  ✗ Failed: {error_msg}")
-                else:
-                    successful += 1
-                    print(f"  ✓ Success")
-            else:
-                # Handle non-dict responses - assume success if no error
-                successful += 1
-                print(f"  ✓ Success")
-                
-        except Exception as e:
-            failed += 1
-            print(f"  ✗ Error: {e}")
-    
-    print(f"\nTraining complete: {successful} successful, {failed} failed")
+            pending[executor.submit(_train_one, client, file_path, dataset_name)] = file_path
+            submitted += 1
+        
+        for future in as_completed(pending):
+            failed += not _report_result(dir_path, pending[future], future.result())
+    
+    if submitted == 0:
+        print(f"No files found in directory {dir_path} with extensions {args.extensions}")
+        return
+    
+    print(f"\nTraining complete: {submitted - failed} successful, {failed} failed")
     
     if failed > 0:
         sys.exit(1)
 
 
-def _collect_files(directory: Path, extensions: List[str], recursive: bool) -> List[Path]:
-    """Collect files to train based on extensions and recursion settings."""
-    files = []
+def _report_result(dir_path: Path, file_path: str, error: Optional[str]) -> bool:
+    """Print the outcome of training one file, returning True if it succeeded."""
+    # os.path.relpath works on plain strings, avoiding the Path
+    # objects Path.relative_to builds for every file
+    relative_path = os.path.relpath(file_path, dir_path)
+    if error is None:
+        print(f"  ✓ {relative_path}")
+        return True
+    
+    print(f"  ✗ {relative_path}: {error}")
+    return False
+
+
+def _train_one(client: 'AskSageClient', file_path: str, dataset_name: str) -> Optional[str]:
+    """Train a single file for directory training, returning an error description or None on success."""
+    try:
+        response = client.train_with_file(
+            file_path=file_path,
+            dataset=dataset_name
+        )
+    except Exception as e:
+        return f"Error: {e}"
+    
+    try:
+        unwrap(response)
+    except ApiError as e:
+        invalidate_datasets_cache(client)
+        return f"Failed: {e}"
     
+    return None
+
+
+def _collect_files(directory: Path, extensions: List[str], recursive: bool) -> Iterator[str]:
+    """
+    Yield paths of files to train based on extensions and recursion settings.
+    
+    Files are yielded while the walk is in progress so uploads can start
+    before the whole tree has been read. Entries within each directory are
+    yielded in sorted order. Paths are plain strings, as the client takes.
+    """
     # Normalize extensions to lowercase and ensure they start with '.'
-    normalized_extensions = []
-    for ext in extensions:
-        ext = ext.lower()
-        if not ext.startswith('.'):
-            ext = '.' + ext
-        normalized_extensions.append(ext)
-    
-    if recursive:
-        pattern = '**/*'
-    else:
-        pattern = '*'
-    
-    for file_path in directory.glob(pattern):
-        if file_path.is_file():
-            if file_path.suffix.lower() in normalized_extensions:
-                files.append(file_path)
-    
-    return sorted(files)
\ No newline at end of file
+    normalized_extensions = frozenset(
+        ext if ext.startswith('.') else '.' + ext
+        for ext in (ext.lower() for ext in extensions)
+    )
+    
+    # Walk with os.scandir, whose entries carry their file type, instead of
+    # stat-ing every path produced by Path.glob
+    pending = [str(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            # Unreadable directories are skipped, as Path.glob does
+            continue
+        
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirectories.append(entry.path)
+            elif entry.is_file():
+                # Same suffix rule as Path.suffix: dotfiles and trailing dots have none
+                name = entry.name
+                dot = name.rfind('.')
+                if 0 < dot < len(name) - 1:
+                    # Most suffixes are already lowercase; skip the copy lower() makes
+                    suffix = name[dot:]
+                    if not suffix.islower():
+                        suffix = suffix.lower()
+                    if suffix in normalized_extensions:
+                        yield entry.path
+        
+        # Reversed so subdirectories are popped, and walked, in sorted order
+        pending.extend(reversed(subdirectories))
+
+
+# Dispatch table for train actions, keyed by subcommand name
+_ACTIONS = {
+    'file': _train_file,
+    'directory': _train_directory,
+}
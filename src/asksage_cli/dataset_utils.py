@@ -1,11 +1,147 @@
 """Utilities for dataset name resolution and management."""
 
+import contextlib
+import functools
+import json
+import os
 import re
-from typing import List, Optional, TYPE_CHECKING
+import tempfile
+import time
+import weakref
+from pathlib import Path
+from typing import Any, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from asksageclient import AskSageClient
 
+# Full dataset names have the form user_custom_<user id>_<short name>_content
+_SHORT_NAME_RE = re.compile(r"user_custom_\d+_(.+)_content$")
+
+# Seconds a successful get_datasets() response is reused, within a process
+# and across runs through the on-disk cache
+DATASETS_CACHE_TTL = 300
+
+# Directory holding per-user dataset lists between runs
+DATASETS_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'asksage'
+
+# Client -> (fetch time, dataset names parsed from get_datasets())
+_datasets_cache: 'weakref.WeakKeyDictionary[Any, tuple[float, List[str]]]' = weakref.WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=256)
+def _full_name_re(short_name: str) -> re.Pattern:
+    """Compile the pattern matching full dataset names for a given short name."""
+    return re.compile(rf"user_custom_\d+_{re.escape(short_name)}_content$")
+
+
+def _cached_dataset_names(client) -> Optional[List[str]]:
+    """Return the dataset names cached in memory or on disk, or None if there are none."""
+    now = time.monotonic()
+    cached = _datasets_cache.get(client)
+    if cached is not None and now - cached[0] < DATASETS_CACHE_TTL:
+        return cached[1]
+    
+    disk_path = _disk_cache_path(client)
+    if disk_path is not None:
+        names = _read_disk_cache(disk_path)
+        if names is not None:
+            _datasets_cache[client] = (now, names)
+            return names
+    
+    return None
+
+
+def _fetch_dataset_names(client) -> Optional[List[str]]:
+    """
+    Fetch and parse the dataset names from the server, caching them on success.
+    
+    Only the parsed list is cached, in memory and (for CliClient) on disk, so
+    later lookups skip both the request and the parse.
+    
+    Returns:
+        List of full dataset names, or None if the server reported an error or
+        returned an unexpected response
+    """
+    response = client.get_datasets()
+    
+    # Handle different response formats
+    if isinstance(response, dict):
+        if response.get('status', 200) >= 400:
+            return None  # Error getting datasets
+        names = response.get('response', [])
+    elif isinstance(response, list):
+        names = response
+    else:
+        return None
+    
+    # Only successful responses are cached so errors are retried on the next call
+    update_datasets_cache(client, names)
+    return names
+
+
+def update_datasets_cache(client, names: List[str]) -> None:
+    """Cache a freshly fetched dataset list for a client, in memory and on disk."""
+    _datasets_cache[client] = (time.monotonic(), names)
+    
+    disk_path = _disk_cache_path(client)
+    if disk_path is not None:
+        _write_disk_cache(disk_path, names)
+
+
+def _disk_cache_path(client) -> Optional[Path]:
+    """
+    Return the on-disk dataset cache file for a client's user.
+    
+    Only clients that opt in through a datasets_cache_key attribute, i.e.
+    CliClient, are persisted; the mock client used in test mode never is.
+    
+    Returns:
+        Path named after the client's cache key, or None if the client has none
+    """
+    key = getattr(client, 'datasets_cache_key', None)
+    if not key:
+        return None
+    return DATASETS_CACHE_DIR / f"datasets-{key}.json"
+
+
+def _read_disk_cache(path: Path) -> Optional[List[str]]:
+    """Load dataset names cached on disk, or None if missing, stale or unreadable."""
+    try:
+        if time.time() - path.stat().st_mtime >= DATASETS_CACHE_TTL:
+            return None
+        names = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return names if isinstance(names, list) else None
+
+
+def _write_disk_cache(path: Path, names: List[str]) -> None:
+    """Atomically replace the on-disk dataset cache; failures are ignored."""
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    except OSError:
+        return
+    
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(names, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Don't leave a partial file behind; the cache is only an optimisation
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def invalidate_datasets_cache(client) -> None:
+    """Forget the cached dataset list for a client, in memory and on disk, after datasets change."""
+    _datasets_cache.pop(client, None)
+    
+    disk_path = _disk_cache_path(client)
+    if disk_path is not None:
+        with contextlib.suppress(OSError):
+            disk_path.unlink()
+
 
 def resolve_dataset_name(client, dataset_name: str) -> Optional[str]:
     """
@@ -16,45 +152,47 @@ def resolve_dataset_name(client, dataset_name: str) -> Optional[str]:
         dataset_name: Either short name (e.g., 'sage-cli') or full name (e.g., 'user_custom_123_sage-cli_content')
     
     Returns:
-        Full unique dataset name if found, None if not found
+        Full unique dataset name if found, None if not found. Names already in
+        full form are returned as-is without listing datasets from the server.
+        A name missing from a cached list is looked up again in a fresh list,
+        so datasets created elsewhere are found straight away.
     """
+    # Names already in full form need no server round-trip
+    if _SHORT_NAME_RE.match(dataset_name):
+        return dataset_name
+    
     try:
-        response = client.get_datasets()
+        cached = _cached_dataset_names(client)
+        if cached is not None:
+            match = _match_dataset_name(cached, dataset_name)
+            if match is not None:
+                return match
+            # The dataset may have been created since the list was cached
+            invalidate_datasets_cache(client)
         
-        # Handle different response formats
-        if isinstance(response, dict):
-            status = response.get('status', 200)
-            if status >= 400:
-                return None  # Error getting datasets
-            all_datasets = response.get('response', [])
-        elif isinstance(response, list):
-            all_datasets = response
-        else:
-            return None
-        
-        # If the provided name is already in the list (exact match), return it
-        if dataset_name in all_datasets:
-            return dataset_name
-        
-        # Look for datasets that match the pattern with this short name
-        pattern = rf"user_custom_\d+_{re.escape(dataset_name)}_content$"
-        
-        matches = [ds for ds in all_datasets if re.match(pattern, ds)]
-        
-        if len(matches) == 1:
-            return matches[0]
-        elif len(matches) > 1:
-            # Multiple matches - this shouldn't happen normally but handle gracefully
-            return matches[0]  # Return the first match
-        else:
-            # No matches found
+        all_datasets = _fetch_dataset_names(client)
+        if all_datasets is None:
             return None
+        return _match_dataset_name(all_datasets, dataset_name)
             
     except Exception:
         # If we can't get datasets, assume the name is correct as-is
         return dataset_name
 
 
+def _match_dataset_name(all_datasets: List[str], dataset_name: str) -> Optional[str]:
+    """Find the full name for dataset_name in a list of dataset names."""
+    # If the provided name is already in the list (exact match), return it
+    if dataset_name in all_datasets:
+        return dataset_name
+    
+    # Look for datasets that match the pattern with this short name. Multiple
+    # matches shouldn't happen normally; the first one wins, so stop there.
+    pattern = _full_name_re(dataset_name)
+    return next((ds for ds in all_datasets if pattern.match(ds)), None)
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_short_name(full_dataset_name: str) -> str:
     """
     Extract the short name from a full dataset name.
@@ -65,8 +203,11 @@ def extract_short_name(full_dataset_name: str) -> str:
     Returns:
         Short name like 'sage-cli', or the original name if it doesn't match the pattern
     """
-    pattern = r"user_custom_\d+_(.+)_content$"
-    match = re.match(pattern, full_dataset_name)
+    # Short names (the common input) can't match; skip the regex for them
+    if not full_dataset_name.startswith('user_custom_'):
+        return full_dataset_name
+    
+    match = _SHORT_NAME_RE.match(full_dataset_name)
     
     if match:
         return match.group(1)
@@ -75,27 +216,14 @@ def extract_short_name(full_dataset_name: str) -> str:
         return full_dataset_name
 
 
-def list_datasets_with_short_names(client) -> List[tuple[str, str]]:
+def format_dataset_name(full_dataset_name: str) -> str:
     """
-    Get all datasets with both their full and short names.
+    Format a dataset name for display.
     
     Returns:
-        List of tuples (full_name, short_name)
+        'short (full)' when the name has a short form, otherwise the name itself
     """
-    try:
-        response = client.get_datasets()
-        
-        # Handle different response formats
-        if isinstance(response, dict):
-            status = response.get('status', 200)
-            if status >= 400:
-                return []  # Error getting datasets
-            all_datasets = response.get('response', [])
-        elif isinstance(response, list):
-            all_datasets = response
-        else:
-            return []
-        
-        return [(ds, extract_short_name(ds)) for ds in all_datasets]
-    except Exception:
-        return []
\ No newline at end of file
+    short_name = extract_short_name(full_dataset_name)
+    if short_name != full_dataset_name:
+        return f"{short_name} ({full_dataset_name})"
+    return full_dataset_name
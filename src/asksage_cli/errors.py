@@ -0,0 +1,23 @@
+"""Error types shared across the CLI."""
+
+import contextlib
+from typing import Iterator
+
+
+class CliError(Exception):
+    """An error reported to the user by main() before exiting with a status code."""
+
+    def __init__(self, message: str, code: int = 1):
+        super().__init__(message)
+        self.code = code
+
+
+@contextlib.contextmanager
+def wrap_errors(prefix: str) -> Iterator[None]:
+    """Re-raise unexpected exceptions as CliError with a prefixed message."""
+    try:
+        yield
+    except CliError:
+        raise
+    except Exception as e:
+        raise CliError(f"{prefix}: {e}") from e
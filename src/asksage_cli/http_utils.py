@@ -0,0 +1,5 @@
+"""HTTP settings shared by the client and commands, importable without loading requests."""
+
+# Connections kept open per host. train directory caps --concurrency at this
+# value so parallel uploads never make urllib3 discard pooled connections.
+POOL_MAXSIZE = 32
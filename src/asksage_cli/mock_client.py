@@ -6,6 +6,17 @@ import os
 import random
 from pathlib import Path
 
+# Mock embedding vector shared by every training response; a tuple so no
+# caller can mutate the shared value
+_MOCK_EMBEDDING = tuple([0.1, 0.2, 0.3] * 100)
+
+# Mock query answers; one is picked per message and formatted with it
+_MOCK_QUERY_TEMPLATES = (
+    "This is a mock response from AskSage AI. Your question was: '{}'",
+    "Mock AI Response: I understand you're asking about '{}'. Here's a simulated answer.",
+    "Simulated AskSage Response: Based on your query '{}', here's what I can tell you...",
+)
+
 
 class MockAskSageClient:
     """Mock client that simulates AskSage API responses without making network calls."""
@@ -24,6 +35,13 @@ class MockAskSageClient:
         ]
         self._current_dataset = None
     
+    def __copy__(self) -> 'MockAskSageClient':
+        """Copy the client, giving the copy its own dataset list to mutate."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._datasets = self._datasets.copy()
+        return clone
+    
     def add_dataset(self, dataset: str) -> Dict[str, Any]:
         """Mock dataset addition."""
         full_name = f"user_custom_{self._user_id}_{dataset}_content"
@@ -48,7 +66,7 @@ class MockAskSageClient:
         self._current_dataset = dataset
         return {"status": 200, "response": f"Dataset {dataset} assigned"}
     
-    def train_with_file(self, file_path: str, context: str = None, dataset: str = None, **kwargs) -> Dict[str, Any]:
+    def train_with_file(self, file_path: str, dataset: str = None, **kwargs) -> Dict[str, Any]:
         """Mock file training."""
         if not os.path.exists(file_path):
             return {"status": 404, "error": f"File not found: {file_path}"}
@@ -57,7 +75,7 @@ class MockAskSageClient:
         return {
             "status": 200,
             "response": f"Successfully trained file {file_path}",
-            "embedding": [0.1, 0.2, 0.3] * 100,  # Mock embedding vector
+            "embedding": _MOCK_EMBEDDING,
             "tokens_used": min(file_size // 4, 1000),  # Mock token calculation
             "dataset": dataset or self._current_dataset
         }
@@ -68,20 +86,15 @@ class MockAskSageClient:
         return {
             "status": 200,
             "response": "Content trained successfully",
-            "embedding": [0.1, 0.2, 0.3] * 100,  # Mock embedding vector
+            "embedding": _MOCK_EMBEDDING,
             "tokens_used": content_length // 4,
             "dataset": kwargs.get('force_dataset') or self._current_dataset
         }
     
     def query(self, message: str, **kwargs) -> Dict[str, Any]:
         """Mock query."""
-        mock_responses = [
-            "This is a mock response from AskSage AI. Your question was: '{}'".format(message),
-            "Mock AI Response: I understand you're asking about '{}'. Here's a simulated answer.".format(message),
-            "Simulated AskSage Response: Based on your query '{}', here's what I can tell you...".format(message)
-        ]
-        
-        response_text = mock_responses[len(message) % len(mock_responses)]
+        template = _MOCK_QUERY_TEMPLATES[len(message) % len(_MOCK_QUERY_TEMPLATES)]
+        response_text = template.format(message)
         
         return {
             "status": 200,
@@ -93,26 +106,26 @@ class MockAskSageClient:
             "teach": False,
             "tokens_used": len(message) // 2,
             "model": "mock-gpt-4o",
-            "dataset": self._current_dataset
+            "dataset": kwargs.get('dataset', self._current_dataset)
         }
     
-    def query_with_file(self, message: str, file_path: str, **kwargs) -> Dict[str, Any]:
+    def query_with_file(self, message: str, file: str = None, **kwargs) -> Dict[str, Any]:
         """Mock query with file."""
-        if not os.path.exists(file_path):
-            return {"status": 404, "error": f"File not found: {file_path}"}
+        if not os.path.exists(file):
+            return {"status": 404, "error": f"File not found: {file}"}
         
-        file_size = os.path.getsize(file_path)
+        file_size = os.path.getsize(file)
         return {
             "status": 200,
-            "message": f"Mock response analyzing file {Path(file_path).name}: {message}",
+            "message": f"Mock response analyzing file {Path(file).name}: {message}",
             "embedding_down": False,
             "vectors_down": False,
             "uuid": "mock-uuid-with-file-12345",
-            "references": [f"File: {Path(file_path).name}"],
+            "references": [f"File: {Path(file).name}"],
             "teach": False,
             "tokens_used": (len(message) + file_size) // 3,
             "model": "mock-gpt-4o",
-            "file_analyzed": file_path
+            "file_analyzed": file
         }
     
     def query_plugin(self, message: str, plugin_name: str, **kwargs) -> Dict[str, Any]:
@@ -127,7 +140,7 @@ class MockAskSageClient:
             "teach": False,
             "tokens_used": len(message) // 2,
             "plugin": plugin_name,
-            "dataset": self._current_dataset
+            "dataset": kwargs.get('dataset', self._current_dataset)
         }
     
     def count_monthly_tokens(self) -> Dict[str, Any]:
@@ -2,48 +2,59 @@
 """
 Test script to understand actual asksageclient API response formats.
 This will help us align the CLI with the real API responses.
+
+Run it with the package installed, e.g. `uv run python test_api_responses.py`;
+pytest finds the package under src/ through pyproject.toml.
 """
 
-import os
+import copy
+import functools
+import inspect
 import sys
-from pathlib import Path
-
-# Add the src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from asksage_cli.mock_client import MockAskSageClient
 
+# Built once; tests take a copy so dataset changes don't leak between them
+_MOCK_CLIENT = MockAskSageClient("test@example.com", "test_key")
+
+@functools.lru_cache(maxsize=None)
+def _signature(cls, name):
+    """Return the signature of a class attribute, computed once per name."""
+    return inspect.signature(getattr(cls, name))
+
 def test_mock_client_responses():
     """Test the mock client to understand expected response formats."""
-    print("=== TESTING MOCK CLIENT RESPONSES ===\n")
+    client = copy.copy(_MOCK_CLIENT)
     
-    client = MockAskSageClient("test@example.com", "test_key")
+    # Build the whole report and write it once instead of printing per line
+    lines = ["=== TESTING MOCK CLIENT RESPONSES ===\n"]
     
-    print("1. Dataset Operations:")
-    print(f"get_datasets(): {repr(client.get_datasets())}")
-    print(f"add_dataset('test'): {repr(client.add_dataset('test'))}")
-    print(f"delete_dataset('test'): {repr(client.delete_dataset('user_custom_145128821_test_content'))}")
-    print()
+    lines.append("1. Dataset Operations:")
+    lines.append(f"get_datasets(): {repr(client.get_datasets())}")
+    lines.append(f"add_dataset('test'): {repr(client.add_dataset('test'))}")
+    lines.append(f"delete_dataset('test'): {repr(client.delete_dataset('user_custom_145128821_test_content'))}")
+    lines.append("")
     
-    print("2. Token Operations:")
-    print(f"count_monthly_tokens(): {repr(client.count_monthly_tokens())}")
-    print(f"count_monthly_teach_tokens(): {repr(client.count_monthly_teach_tokens())}")
-    print()
+    lines.append("2. Token Operations:")
+    lines.append(f"count_monthly_tokens(): {repr(client.count_monthly_tokens())}")
+    lines.append(f"count_monthly_teach_tokens(): {repr(client.count_monthly_teach_tokens())}")
+    lines.append("")
     
-    print("3. Query Operations:")
-    print(f"query('test'): {repr(client.query('test'))}")
-    print()
+    lines.append("3. Query Operations:")
+    lines.append(f"query('test'): {repr(client.query('test'))}")
+    lines.append("")
     
-    # Create a test file for training
-    test_file = "/tmp/test_api_response.txt"
-    with open(test_file, "w") as f:
+    # Create a test file for training; it is removed when the block exits
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt") as f:
         f.write("Test content for API response testing")
+        f.flush()
+        
+        lines.append("4. Training Operations:")
+        lines.append(f"train_with_file(): {repr(client.train_with_file(f.name, dataset='test'))}")
     
-    print("4. Training Operations:")
-    print(f"train_with_file(): {repr(client.train_with_file(test_file, dataset='test'))}")
-    
-    # Clean up
-    os.unlink(test_file)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def test_real_client_import():
     """Test importing the real client to see if we can inspect it."""
@@ -55,10 +66,9 @@ def test_real_client_import():
         print(f"AskSageClient methods: {[m for m in dir(AskSageClient) if not m.startswith('_')]}")
         
         # Try to inspect method signatures
-        import inspect
         for method in ['get_datasets', 'add_dataset', 'delete_dataset', 'train_with_file', 'query', 'count_monthly_tokens']:
             if hasattr(AskSageClient, method):
-                sig = inspect.signature(getattr(AskSageClient, method))
+                sig = _signature(AskSageClient, method)
                 print(f"{method} signature: {sig}")
         
         # Try to inspect source or docstrings
@@ -78,22 +88,23 @@ def test_real_client_with_dummy_credentials():
         # Create client with dummy credentials to see what error responses look like
         client = AskSageClient("fake@example.com", "fake_api_key")
         
-        # Try to call methods and see what error formats we get
-        try:
-            result = client.get_datasets()
-            print(f"get_datasets() with fake creds: {repr(result)}")
-        except Exception as e:
-            print(f"get_datasets() error: {type(e).__name__}: {e}")
-            
-        try:
-            result = client.count_monthly_tokens()
-            print(f"count_monthly_tokens() with fake creds: {repr(result)}")
-        except Exception as e:
-            print(f"count_monthly_tokens() error: {type(e).__name__}: {e}")
+        # Try to call methods and see what error formats we get; the calls
+        # are independent network round-trips, so make them concurrently
+        methods = ['get_datasets', 'count_monthly_tokens']
+        with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+            for line in executor.map(lambda method: _describe_call(client, method), methods):
+                print(line)
         
     except Exception as e:
         print(f"Error creating or testing real client: {e}")
 
+def _describe_call(client, method):
+    """Call a client method with no arguments and describe its result or error."""
+    try:
+        return f"{method}() with fake creds: {repr(getattr(client, method)())}"
+    except Exception as e:
+        return f"{method}() error: {type(e).__name__}: {e}"
+
 if __name__ == "__main__":
     test_mock_client_responses()
     test_real_client_import()
@@ -0,0 +1,110 @@
+"""Tests for the dataset list caches in dataset_utils."""
+
+import os
+import time
+
+import pytest
+
+from asksage_cli import dataset_utils
+from asksage_cli.dataset_utils import invalidate_datasets_cache, resolve_dataset_name, update_datasets_cache
+
+DOCS = "user_custom_9_docs_content"
+NEWDS = "user_custom_9_newds_content"
+
+
+class FakeClient:
+    """Client whose dataset list can change between get_datasets() calls."""
+
+    def __init__(self, datasets, cache_key="testkey"):
+        self.datasets = list(datasets)
+        self.fetches = 0
+        if cache_key is not None:
+            self.datasets_cache_key = cache_key
+
+    def get_datasets(self):
+        self.fetches += 1
+        return {"status": 200, "response": list(self.datasets)}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_utils, 'DATASETS_CACHE_DIR', tmp_path)
+    return tmp_path
+
+
+def test_list_is_fetched_once_per_client():
+    client = FakeClient([DOCS])
+
+    assert resolve_dataset_name(client, "docs") == DOCS
+    assert resolve_dataset_name(client, "docs") == DOCS
+    assert client.fetches == 1
+
+
+def test_disk_cache_is_shared_across_runs(cache_dir):
+    resolve_dataset_name(FakeClient([DOCS]), "docs")
+    assert (cache_dir / "datasets-testkey.json").exists()
+
+    # A new client for the same user, as in the next CLI run
+    client = FakeClient([DOCS])
+    assert resolve_dataset_name(client, "docs") == DOCS
+    assert client.fetches == 0
+
+
+def test_stale_disk_cache_is_refetched(cache_dir):
+    resolve_dataset_name(FakeClient([DOCS]), "docs")
+
+    old = time.time() - dataset_utils.DATASETS_CACHE_TTL - 1
+    os.utime(cache_dir / "datasets-testkey.json", (old, old))
+
+    client = FakeClient([DOCS])
+    assert resolve_dataset_name(client, "docs") == DOCS
+    assert client.fetches == 1
+
+
+def test_miss_in_cached_list_refetches():
+    client = FakeClient([DOCS])
+    resolve_dataset_name(client, "docs")
+
+    # Dataset created outside this client after the list was cached
+    client.datasets.append(NEWDS)
+    assert resolve_dataset_name(client, "newds") == NEWDS
+    assert client.fetches == 2
+
+    # The refreshed list is cached again
+    assert resolve_dataset_name(client, "newds") == NEWDS
+    assert client.fetches == 2
+
+
+def test_unknown_name_returns_none_after_one_refetch():
+    client = FakeClient([DOCS])
+    resolve_dataset_name(client, "docs")
+
+    assert resolve_dataset_name(client, "missing") is None
+    assert client.fetches == 2
+
+
+def test_invalidate_clears_memory_and_disk(cache_dir):
+    client = FakeClient([DOCS])
+    resolve_dataset_name(client, "docs")
+
+    invalidate_datasets_cache(client)
+
+    assert not (cache_dir / "datasets-testkey.json").exists()
+    resolve_dataset_name(client, "docs")
+    assert client.fetches == 2
+
+
+def test_update_datasets_cache_is_used_by_resolver():
+    client = FakeClient([])
+    update_datasets_cache(client, [NEWDS])
+
+    assert resolve_dataset_name(client, "newds") == NEWDS
+    assert client.fetches == 0
+
+
+def test_clients_without_cache_key_are_not_persisted(cache_dir):
+    client = FakeClient([DOCS], cache_key=None)
+    client.email = "test@example.com"
+
+    assert resolve_dataset_name(client, "docs") == DOCS
+    assert list(cache_dir.iterdir()) == []